@@ -15,15 +15,53 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache, singledispatch
 from typing import Final, Union
 
 
+@lru_cache(maxsize=8)
+def _encode_base(base: str) -> bytes:
+    """
+    Encode the base alphabet to ASCII bytes.
+
+    The encoded alphabet is cached per base alphabet.
+
+    :param base: Base to encode.
+    :return: Encoded base alphabet.
+    """
+    return base.encode('ascii')
+
+
+@lru_cache(maxsize=8)
+def _build_lut(base: str) -> bytes:
+    """
+    Build a 256-entry digit lookup table for the base.
+
+    Maps the ASCII code of each base character to its
+    digit value plus one & every other code to zero.
+
+    The table is cached per base alphabet.
+
+    :param base: Base to build the table for.
+    :return: Lookup table.
+    """
+    lut: Final[bytearray] = bytearray(256)
+
+    for i, b in enumerate(base.encode('ascii')):
+        lut[b] = i + 1
+
+    return bytes(lut)
+
+
 def to_base(num: int, base: str) -> str:
     """
     Convert an integer number to a string based on the specified base.
 
     The conversion uses a conversion format that does not include zero.
 
+    Writes digits right-to-left into a preallocated buffer
+    so that only the final string is ever allocated.
+
     :param num: Number to be converted.
     :param base: Base of the result.
     :return: Number-string with base of the specified base.
@@ -32,15 +70,22 @@ def to_base(num: int, base: str) -> str:
     if num < 1:
         raise ValueError()
 
-    base_len: Final[int] = len(base)
+    base_bytes: Final[bytes] = _encode_base(base)
+    base_len: Final[int] = len(base_bytes)
+
+    buf: bytearray = bytearray(32)
+    pos: int = len(buf)
 
-    r: str = ''
     while num:
-        mod: int = (num - 1) % base_len
-        r = base[mod] + r
-        num = (num - mod) // base_len
+        if not pos:
+            buf[:0] = bytes(len(buf))
+            pos = len(buf) // 2
 
-    return r
+        num, mod = divmod(num - 1, base_len)
+        pos -= 1
+        buf[pos] = base_bytes[mod]
+
+    return buf[pos:].decode('ascii')
 
 
 def from_base(num: str, base: str) -> int:
@@ -49,34 +94,52 @@ def from_base(num: str, base: str) -> int:
 
     The conversion uses a conversion format that does not include zero.
 
+    Operates on ASCII bytes with a 256-entry digit lookup table
+    so that each digit costs a single indexed load.
+
     :param num: Number to be converted.
     :param base: Base of the number.
     :return: Integer number with base 10.
+    :raise ValueError: If the number contains a character that is not present in the base.
     """
     base_len: Final[int] = len(base)
+    lut: Final[bytes] = _build_lut(base)
 
     r: int = 0
-    for i in num:
-        r = r * base_len + base.index(i) + 1
+    for b in num.encode('ascii'):
+        digit: int = lut[b]
+
+        if not digit:
+            raise ValueError()
+
+        r = r * base_len + digit
 
     return r
 
 
+@singledispatch
 def swap_base(num: Union[str, int], base: str) -> Union[str, int]:
     """
     Swap the base of the number.
 
     The conversion uses a conversion format that does not include zero.
 
+    Dispatches on the type of the number through a single-dispatch
+    registry instead of chained isinstance checks.
+
     :param num: Number to be converted.
     :param base: Base of the number or result.
     :return: Number-string if the number is of type int otherwise an integer number if the number is of type str.
     :raise ValueError: If the number is not an instance of type int or str.
     """
-    if isinstance(num, int):
-        return to_base(num, base)
+    raise ValueError()
 
-    if isinstance(num, str):
-        return from_base(num, base)
 
-    raise ValueError()
+@swap_base.register
+def _(num: int, base: str) -> str:
+    return to_base(num, base)
+
+
+@swap_base.register
+def _(num: str, base: str) -> int:
+    return from_base(num, base)
@@ -17,8 +17,14 @@
 
 import os
 
+import re as regx
+
+from io import StringIO
+from hashlib import blake2b
+from functools import lru_cache
+from types import MappingProxyType
 from configparser import ConfigParser
-from typing import Final, Union
+from typing import Final, Optional, Union
 
 
 class Section:
@@ -44,6 +50,7 @@ class Property:
     :cvar URL_MAX_LEN: Url maximum length property name.
     :cvar MENU_HISTORY: Menu history property name.
     :cvar URL_HISTORY: Url history property name.
+    :cvar CONCURRENCY: Concurrency property name.
     """
     OUTPUT_FILE_NAME: Final[str] = 'Out. File Name'
     INPUT_FILE_NAME: Final[str] = 'In. File Name'
@@ -53,6 +60,7 @@ class Property:
     URL_MAX_LEN: Final[str] = 'Url Max. Length'
     MENU_HISTORY: Final[str] = 'Menu History'
     URL_HISTORY: Final[str] = 'Url History'
+    CONCURRENCY: Final[str] = 'Concurrency'
 
 
 class Pattern:
@@ -79,10 +87,25 @@ class Endpoint:
     GROUPS: Final[str] = 'groups'
 
 
+@lru_cache(maxsize=64)
+def get_compiled(pattern: str) -> regx.Pattern:
+    """
+    Compile the pattern & cache the result.
+
+    Repeated lookups for the same pattern e.g. the Pattern
+    defaults or a configured user pattern hit the cache.
+
+    :param pattern: Pattern to compile.
+    :return: Compiled pattern.
+    :raise re.error: If the pattern is invalid.
+    """
+    return regx.compile(pattern)
+
+
 data_path: Final[str] = 'data/'
 
 _config_path: Final[str] = data_path + 'config.ini'
-_default_params: Final[dict[str, Union[str, int, bool]]] = {
+_default_params: Final[MappingProxyType[str, Union[str, int, bool]]] = MappingProxyType({
     Property.OUTPUT_FILE_NAME: 'Available.txt',
     Property.INPUT_FILE_NAME: 'Checkable.txt',
     Property.ENDPOINT: Endpoint.ID,
@@ -90,11 +113,27 @@ _default_params: Final[dict[str, Union[str, int, bool]]] = {
     Property.URL_MIN_LEN: 3,
     Property.URL_MAX_LEN: 3,
     Property.MENU_HISTORY: False,
-    Property.URL_HISTORY: True
-}
+    Property.URL_HISTORY: True,
+    Property.CONCURRENCY: 128
+})
 
 config: Final[ConfigParser] = ConfigParser()
 
+_cached_stat: Optional[tuple[int, int]] = None
+_last_written_hash: Optional[bytes] = None
+
+
+def _stat_key(path: str) -> tuple[int, int]:
+    """
+    Build a config file cache key from the file stats.
+
+    :param path: Path to the file.
+    :return: Tuple of the file modification time and size.
+    """
+    st: Final[os.stat_result] = os.stat(path)
+
+    return st.st_mtime_ns, st.st_size
+
 
 def init_cfg() -> None:
     """
@@ -115,10 +154,31 @@ def save_cfg() -> None:
     Creates and saves config to a
     file at the path "./data/config.ini"
 
+    Serializes the config in memory first & skips the disk
+    write entirely when the content has not changed since
+    the last save and the file is still present. The file
+    is replaced atomically through a temporary file.
+
     :return: None.
     """
-    with open(_config_path, 'w') as cfg_file:
-        config.write(cfg_file)
+    buf: Final[StringIO] = StringIO()
+    config.write(buf)
+
+    data: Final[str] = buf.getvalue()
+    digest: Final[bytes] = blake2b(data.encode(), digest_size=16).digest()
+
+    global _cached_stat, _last_written_hash
+    if digest == _last_written_hash and os.path.isfile(_config_path):
+        return
+
+    tmp_path: Final[str] = _config_path + '.tmp'
+    with open(tmp_path, 'w') as cfg_file:
+        cfg_file.write(data)
+
+    os.replace(tmp_path, _config_path)
+
+    _cached_stat = _stat_key(_config_path)
+    _last_written_hash = digest
 
 
 def read_cfg() -> None:
@@ -128,21 +188,46 @@ def read_cfg() -> None:
     Reads a config file or assigns a global
     config variable with default parameters.
 
+    Skips re-parsing the file if its modification
+    time and size have not changed since the last read.
+
     :return: None.
     """
     if os.path.isfile(_config_path):
+        global _cached_stat
+        stat_key: Final[tuple[int, int]] = _stat_key(_config_path)
+
+        if stat_key == _cached_stat:
+            return
+
         config.read(_config_path)
+        _cached_stat = stat_key
     else:
-        config[Section.DEFAULT] = \
-            config[Section.USER] = _default_params
+        config[Section.DEFAULT] = dict(_default_params)
+        config[Section.USER] = dict(_default_params)
+
+
+def touch_cfg() -> None:
+    """
+    Mark the in-memory config as modified.
+
+    Drops the cached file stats so that the next
+    read_cfg call re-reads the file from disk.
+
+    :return: None.
+    """
+    global _cached_stat
+    _cached_stat = None
 
 
 def reset_cfg() -> None:
     """
     Reset user config section.
 
-    Assigns user config section with default config section.
+    Assigns user config section with a
+    copy of the default config section.
 
     :return: None.
     """
-    config[Section.USER] = config[Section.DEFAULT]
+    config[Section.USER] = dict(config[Section.DEFAULT])
+    touch_cfg()
@@ -15,8 +15,6 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import steam
-
 from config import Endpoint
 
 
@@ -24,8 +22,13 @@ def uid_action() -> None:
     """
     Call this function for the .github/workflows/uid-action.yml workflow.
 
+    Imports the steam module lazily so that importing
+    this module does not pay for the steam import graph.
+
     :return: None.
     """
+    import steam
+
     def wrapper(min_len: int, max_len: int, endpoint: str) -> None:
         """
         Generate, check, and save steam vanity urls.
@@ -17,20 +17,35 @@
 
 import builtins
 import os
-
-import asyncio
-import cursor
+import sys
+import shutil
 
 from config import init_cfg, read_cfg
 from typing import Final, Callable, Optional
-from menu import Menu, ConfigMenu, SteamMenu
 
 from argparse import ArgumentParser, Namespace
 
-import github
-
 _license_path: Final[str] = f'{os.path.dirname(__file__)}/../COPYING'
 
+_gh_flags: Final[tuple[str, ...]] = ('gh_uid_action',)
+
+_show_cursor: Final[bytes] = b'\x1b[?25h'
+_hide_cursor: Final[bytes] = b'\x1b[?25l'
+
+
+def _write_cursor(seq: bytes) -> None:
+    """
+    Write a cursor escape sequence directly to stdout.
+
+    Writes only when stdout is attached to a terminal.
+
+    :param seq: Escape sequence to write.
+    :return: None.
+    """
+    if sys.stdout.isatty():
+        sys.stdout.buffer.write(seq)
+        sys.stdout.flush()
+
 
 def _is_gh_args(_args: Namespace) -> bool:
     """
@@ -39,11 +54,7 @@ def _is_gh_args(_args: Namespace) -> bool:
     :param _args: Command line arguments.
     :return: Boolean.
     """
-    for key, val in _args.__dict__.items():
-        if key.startswith('gh_') and val:
-            return True
-
-    return False
+    return any(getattr(_args, name, False) for name in _gh_flags)
 
 
 def _init_builtins() -> None:
@@ -64,10 +75,13 @@ def _init_builtins() -> None:
         Enables the cursor when entering text
         and disables it when exiting input.
 
+        Toggles the cursor with single escape sequence
+        writes instead of going through the cursor module.
+
         :param prompt: Input prefix.
         :return: String or None.
         """
-        cursor.show()
+        _write_cursor(_show_cursor)
 
         result = None
         try:
@@ -75,15 +89,13 @@ def _init_builtins() -> None:
         except KeyboardInterrupt:
             print()
 
-        cursor.hide()
+        _write_cursor(_hide_cursor)
         return result
 
     builtins.input = new_input
 
 
 if __name__ == '__main__':
-    asyncio.set_event_loop(asyncio.new_event_loop())
-
     arg_parser: Final[ArgumentParser] = ArgumentParser()
 
     arg_parser.add_argument(
@@ -103,18 +115,49 @@ if __name__ == '__main__':
     args: Final[Namespace] = arg_parser.parse_args()
 
     if args.is_license:
-        with open(_license_path, 'r') as license_file:
-            print(license_file.read())
+        with open(_license_path, 'rb') as license_file:
+            sys.stdout.flush()
+
+            try:
+                if not hasattr(os, 'sendfile'):
+                    raise OSError
+
+                size: Final[int] = os.fstat(license_file.fileno()).st_size
+
+                # sendfile may transfer fewer bytes than requested
+                # e.g. on a short write to a pipe — loop until done.
+                offset: int = 0
+                while offset < size:
+                    sent: int = os.sendfile(
+                        sys.stdout.fileno(),
+                        license_file.fileno(),
+                        offset,
+                        size - offset
+                    )
+
+                    if not sent:
+                        break
+
+                    offset += sent
+            except OSError:
+                shutil.copyfileobj(license_file, sys.stdout.buffer)
 
         exit()
 
     # GitHub Actions
     if _is_gh_args(args):
+        import github
+
         if args.gh_uid_action:
             github.uid_action()
 
         exit()
 
+    import cursor
+
+    from util import cls
+    from menu import Menu, ConfigMenu, SteamMenu
+
     _init_builtins()
 
     init_cfg()
@@ -134,5 +177,5 @@ if __name__ == '__main__':
     except (KeyError, KeyboardInterrupt):
         pass
 
-    os.system('cls')
+    cls()
     cursor.show()
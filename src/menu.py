@@ -15,13 +15,16 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import os
 import util
 import steam
 
 from typing import Callable, Final, Union, Optional, Any, Type
 from PyInquirer import prompt, Separator
-from config import config, save_cfg, read_cfg, reset_cfg, data_path, Section, Property, Pattern, Endpoint
+from config import config, save_cfg, read_cfg, reset_cfg, touch_cfg, data_path, Section, Property, Pattern, Endpoint
+
+from colorama import just_fix_windows_console
+
+just_fix_windows_console()
 
 separator: Final[Separator] = Separator(' ')
 
@@ -30,6 +33,7 @@ class MenuElement:
     """
     Defines the basic menu element.
     """
+    __slots__ = ('_message', '_parent', '__select_call')
 
     def __init__(self, message: str, select_call: Optional[Callable] = None, parent: Optional = None) -> None:
         # noinspection PyUnresolvedReferences
@@ -70,6 +74,7 @@ class ExitMenuElement(MenuElement):
 
     When selected, exits the program.
     """
+    __slots__ = ()
 
     def __init__(self, name: str = 'Exit') -> None:
         """
@@ -96,6 +101,7 @@ class BackMenuElement(MenuElement):
 
     When selected, returns to the parent.
     """
+    __slots__ = ()
 
     def __init__(self, parent, name: str = 'Back') -> None:
         """
@@ -114,6 +120,8 @@ class Menu(MenuElement):
 
     :cvar __exit_element: Final static reference to an ExitMenuElement instance.
     """
+    __slots__ = ('__name', '__elements', '__choices', '__questions', '__questions_list')
+
     __exit_element: Final[MenuElement] = ExitMenuElement()
 
     def __init__(self, name: str, message: Optional[str] = None) -> None:
@@ -139,6 +147,7 @@ class Menu(MenuElement):
             'message': self._message,
             'choices': self.__choices,
         }
+        self.__questions_list: Final[list[dict[str, Any]]] = [self.__questions]
 
     def append(self, element: Optional, use_exit: bool = True) -> None:
         """
@@ -197,7 +206,7 @@ class Menu(MenuElement):
 
         :return: Selected MenuElement.
         """
-        return self.__elements[prompt([self.__questions], keyboard_interrupt_msg='')[self.__name]]
+        return self.__elements[prompt(self.__questions_list, keyboard_interrupt_msg='')[self.__name]]
 
     def render(self) -> None:
         """
@@ -208,9 +217,11 @@ class Menu(MenuElement):
         prev_element: MenuElement = self
         curr_element: MenuElement = prev_element
 
+        getboolean: Final[Callable] = config.getboolean
+
         while True:
-            if not config.getboolean(Section.USER, Property.MENU_HISTORY):
-                os.system('cls')
+            if not getboolean(Section.USER, Property.MENU_HISTORY):
+                util.cls()
 
             next_element: Optional[MenuElement] = curr_element.select()
 
@@ -225,6 +236,7 @@ class GenUrlsElement(MenuElement):
     """
     Defines a MenuElement wrapper for steam.bz_gen_urls & steam.fp_gen_urls.
     """
+    __slots__ = ('__use_file',)
 
     def __init__(self, name: str, use_file: bool, parent: Optional[Menu] = None) -> None:
         """
@@ -260,13 +272,15 @@ class GenUrlsElement(MenuElement):
 
         :return: None.
         """
+        user_cfg: Final = config[Section.USER]
+
         steam.bz_gen_urls(
-            config.getint(Section.USER, Property.URL_MIN_LEN),
-            config.getint(Section.USER, Property.URL_MAX_LEN),
+            user_cfg.getint(Property.URL_MIN_LEN),
+            user_cfg.getint(Property.URL_MAX_LEN),
 
-            config[Section.USER][Property.PATTERN],
+            user_cfg[Property.PATTERN],
 
-            config.getboolean(Section.USER, Property.URL_HISTORY)
+            user_cfg.getboolean(Property.URL_HISTORY)
         )
 
     @staticmethod
@@ -283,6 +297,7 @@ class CheckUrlsElement(MenuElement):
     """
     Defines a MenuElement wrapper for steam.check_urls.
     """
+    __slots__ = ()
 
     def __init__(self, name: str = 'Check', parent: Optional[Menu] = None) -> None:
         """
@@ -302,15 +317,18 @@ class CheckUrlsElement(MenuElement):
 
         :return: None.
         """
+        user_cfg: Final = config[Section.USER]
+
         try:
             steam.check_urls(
-                config[Section.USER][Property.ENDPOINT],
-                config.getboolean(Section.USER, Property.URL_HISTORY)
+                user_cfg[Property.ENDPOINT],
+                user_cfg.getboolean(Property.URL_HISTORY),
+                user_cfg.getint(Property.CONCURRENCY)
             )
         except KeyboardInterrupt:
             pass
 
-        steam.save_urls(data_path + config[Section.USER][Property.OUTPUT_FILE_NAME])
+        steam.save_urls(data_path + user_cfg[Property.OUTPUT_FILE_NAME])
 
 
 class SteamMenu(Menu):
@@ -318,6 +336,7 @@ class SteamMenu(Menu):
     Defines a default steam menu that includes
     GenUrlsElement & CheckUrlsElement elements.
     """
+    __slots__ = ()
 
     def __init__(self, name: str = 'Steam') -> None:
         """
@@ -343,6 +362,7 @@ class ConfigElement(MenuElement):
     Defines a MenuElement that can
     update a config property value.
     """
+    __slots__ = ('_token', '__val_call')
 
     def __init__(self, token: str, name: str, val_call: Callable, parent: Optional[Menu] = None) -> None:
         """
@@ -363,9 +383,13 @@ class ConfigElement(MenuElement):
         """
         Update the config property with a new value.
 
+        Marks the config as modified so that a
+        subsequent read reverts to the on-disk values.
+
         :return: None.
         """
         config[Section.USER][self._token] = str(self.__val_call())
+        touch_cfg()
 
 
 class RawConfigElement(ConfigElement):
@@ -374,6 +398,7 @@ class RawConfigElement(ConfigElement):
     overrides self.__upd_param with
     raw lambda that returns value.
     """
+    __slots__ = ()
 
     def __init__(self, token: str, name: str, value, parent: Optional[Menu] = None) -> None:
         """
@@ -393,6 +418,7 @@ class CustomConfigElement(ConfigElement):
     Adds a feature for custom input
     to define a new property value.
     """
+    __slots__ = ('_prompt_message',)
 
     def __init__(self, token: str, name: Optional[str] = None, prompt_message: str = '> ') -> None:
         """
@@ -424,6 +450,7 @@ class RangeCustomConfigElement(CustomConfigElement):
     Adds a feature for custom input
     to define a range of properties.
     """
+    __slots__ = ('__min_val', '__max_val', '__cast_call')
 
     def __init__(self, token: str,
                  min_val: Union[Callable[[], Union[int, float]], str, int, float],
@@ -488,6 +515,7 @@ class BooleanConfigMenu(Menu):
 
     :cvar __type_names: Table of rows with selection names.
     """
+    __slots__ = ()
 
     class Type:
         """
@@ -526,6 +554,7 @@ class EnumConfigMenu(Menu):
     """
     Defines config menu for the enum classes.
     """
+    __slots__ = ()
 
     def __init__(self, token: str, clazz: Type, customizable: bool) -> None:
         """
@@ -573,11 +602,15 @@ class ConfigMenu(Menu):
      updates url minimum length property value.
     :cvar __url_max_len_element: Final static reference to a RangeCustomConfigElement instance that
      updates url maximum length property value.
+    :cvar __concurrency_element: Final static reference to a RangeCustomConfigElement instance that
+     updates concurrency property value.
     :cvar __menu_history_menu: Final static reference to a BooleanConfigMenu instance that
      updates menu history property value.
     :cvar __url_history_menu: Final static reference to a BooleanConfigMenu instance that
      updates url history property value.
     """
+    __slots__ = ()
+
     __save_cfg_element: Final[MenuElement] = MenuElement('Save', save_cfg)
     __read_cfg_element: Final[MenuElement] = MenuElement('Read', read_cfg)
     __reset_cfg_element: Final[MenuElement] = MenuElement('Reset', reset_cfg)
@@ -591,6 +624,8 @@ class ConfigMenu(Menu):
     __url_min_len_element: Final[MenuElement] = RangeCustomConfigElement(Property.URL_MIN_LEN, 2, Property.URL_MAX_LEN)
     __url_max_len_element: Final[MenuElement] = RangeCustomConfigElement(Property.URL_MAX_LEN, Property.URL_MIN_LEN, 4)
 
+    __concurrency_element: Final[MenuElement] = RangeCustomConfigElement(Property.CONCURRENCY, 1, 1024)
+
     __menu_history_menu: Final[Menu] = BooleanConfigMenu(Property.MENU_HISTORY, BooleanConfigMenu.Type.SWITCH)
     __url_history_menu: Final[Menu] = BooleanConfigMenu(Property.URL_HISTORY, BooleanConfigMenu.Type.SWITCH)
 
@@ -615,6 +650,8 @@ class ConfigMenu(Menu):
             self.__url_min_len_element,
             self.__url_max_len_element,
 
+            self.__concurrency_element,
+
             separator,
 
             self.__menu_history_menu,
@@ -17,35 +17,62 @@
 
 import asyncio
 import os
+import sys
 
 import re as regx
 
 # noinspection PyPep8Naming
 from sre_constants import error as RegexError
 
-from typing import Final, Optional
+from typing import Callable, Final, Iterator, Optional
 from string import ascii_lowercase, digits
-from aiohttp import ClientSession, ClientTimeout, ClientError
-from base import to_base, from_base
+from itertools import product
+from aiohttp import ClientSession, ClientTimeout, ClientError, TCPConnector
 from config import Pattern
+from util import compile_fast_pattern
 
 # noinspection PyPep8Naming
 from colorama import Fore as fclr
 
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 _base: Final[str] = ascii_lowercase + digits + '-_'
 _url_format: Final[str] = 'https://steamcommunity.com/%s/%s'
 
-_default_timeout: Final[ClientTimeout] = ClientTimeout()
+_default_timeout: Final[ClientTimeout] = ClientTimeout(total=None, sock_connect=5, sock_read=10)
 _default_pattern: Final[str] = Pattern.ANY
 _default_history: Final[bool] = False
+_default_concurrency: Final[int] = 128
+
+_max_content_len: Final[int] = 8192
 
-gen_list: list[str] = []
+_return_link: Final[bytes] = b'<p class="returnLink">'
+_group_removed: Final[bytes] = b'This group has been removed'
+
+# One pass over the buffer: the return link marker must be present
+# & not followed by the group removed marker within the read bound.
+_check_pattern: Final[regx.Pattern] = regx.compile(
+    regx.escape(_return_link)
+    + rb'(?![\s\S]{0,%d}' % _max_content_len
+    + regx.escape(_group_removed)
+    + rb')'
+)
+
+gen_source: Optional[Callable[[], Iterator[str]]] = None
 check_list: list[str] = []
 
 
 def bz_gen_urls(min_len: int, max_len: int, pattern: Optional[str] = None, history: Optional[bool] = None) -> None:
     """
-    Generate a list of steam vanity URls based on minimum and maximum length and pattern.
+    Generate a source of steam vanity URls based on minimum and maximum length and pattern.
+
+    Candidates are streamed on demand instead of being
+    materialized, so they only live while being consumed.
 
     :param min_len: Minimum url length.
     :param max_len: Maximum url length.
@@ -63,32 +90,48 @@ def bz_gen_urls(min_len: int, max_len: int, pattern: Optional[str] = None, histo
     if not history:
         history = _default_history
 
-    global gen_list
-    gen_list.clear()
+    global gen_source
+    gen_source = None
 
-    left: Final[int] = from_base(_base[0] * min_len, _base)
-    right: Final[int] = from_base(_base[-1] * max_len, _base)
+    accept_all: Final[bool] = pattern in ('', '.*', '.+')
 
-    try:
-        cmpl_pattern: Final[regx.Pattern] = regx.compile(pattern)
-    except RegexError:
-        return
+    search: Optional[Callable[[str], object]] = None
+    if not accept_all:
+        try:
+            search = compile_fast_pattern(pattern)
+        except RegexError:
+            return
+
+    def _gen() -> Iterator[str]:
+        """
+        Yield every matching url candidate.
+
+        :return: Iterator of urls.
+        """
+        print_url: Final[Callable[[str], None]] = _print_url
+        join: Final[Callable] = ''.join
 
-    for i in range(left, right):
-        url: str = to_base(i, _base)
-        if cmpl_pattern.search(url):
-            gen_list.append(url)
+        for url_len in range(min_len, max_len + 1):
+            for chars in product(_base, repeat=url_len):
+                url: str = join(chars)
 
-            if history:
-                _print_url(url)
+                if accept_all or search(url):
+                    if history:
+                        print_url(url)
+
+                    yield url
+
+    gen_source = _gen
 
 
 def fp_gen_urls(file_path: str) -> None:
     """
-    Generate a list of steam vanity urls from a file.
+    Generate a source of steam vanity urls from a file.
 
     Creates a file if it does not exist at the specified path.
 
+    The file is read lazily when the source is consumed.
+
     :param file_path: Path to file.
     :return: None.
     """
@@ -96,74 +139,155 @@ def fp_gen_urls(file_path: str) -> None:
         with open(file_path, 'w'):
             pass
 
-    with open(file_path, 'r') as in_file:
-        global gen_list
-        gen_list = [url for url in in_file.read().split('\n') if url]
+    def _gen() -> Iterator[str]:
+        """
+        Yield every url from the file.
+
+        :return: Iterator of urls.
+        """
+        with open(file_path, 'r', buffering=1 << 20) as in_file:
+            for line in in_file:
+                url: str = line.strip()
+
+                if url:
+                    yield url
+
+    global gen_source
+    gen_source = _gen
 
 
-def check_urls(endpoint: str, history: Optional[bool] = None) -> None:
+def check_urls(endpoint: str, history: Optional[bool] = None, concurrency: Optional[int] = None) -> None:
     """
     Check all generated steam vanity urls.
 
+    Consumes the current url source, so urls only
+    live while their requests are in flight.
+
+    Runs at most the specified number of requests concurrently
+    through a fixed pool of workers sharing one url iterator.
+
     :param endpoint: Endpoint to add a vanity url to.
     :param history: Defines the output of urls.
+    :param concurrency: Maximum number of concurrent requests.
     :return: None.
     """
-    if not gen_list:
+    if not gen_source:
         return
 
     if not history:
         history = _default_history
 
+    if not concurrency:
+        concurrency = _default_concurrency
+
     check_list.clear()
 
-    async def check_url(session: ClientSession, url: str) -> None:
+    url_prefix: Final[str] = _url_format % (endpoint, '')
+
+    async def check_url(session: ClientSession, url: str, hits: list[str], buf: bytearray) -> None:
         """
         Check the specified steam vanity url.
 
+        Reads only a bounded prefix of the response body —
+        the checked markers appear early in the page — and
+        matches the markers on raw bytes without decoding.
+
+        The body is read into a caller-owned buffer, so no
+        per-request bytes objects are allocated.
+
         :param session: Client session.
         :param url: Vanity url itself.
+        :param hits: List to append the url to if it is available.
+        :param buf: Reusable read buffer of _max_content_len size.
         :return: None.
         """
-        async with session.get(_url_format % (endpoint, url)) as response:
-            try:
+        try:
+            async with session.get(url_prefix + url, allow_redirects=False) as response:
                 if history:
                     _print_url(url)
 
-                content: Final[str] = await response.text()
+                n: int = 0
+                async for chunk in response.content.iter_chunked(4096):
+                    end: int = min(n + len(chunk), _max_content_len)
+                    buf[n:end] = chunk[:end - n]
+                    n = end
 
-                if content \
-                        and '<p class="returnLink">' in content \
-                        and 'This group has been removed' not in content:
-                    check_list.append(url)
-            except (ValueError, ClientError):
-                pass
+                    if n >= _max_content_len:
+                        break
+
+                if _check_pattern.search(memoryview(buf)[:n]):
+                    hits.append(url)
+        except (ValueError, ClientError, asyncio.TimeoutError):
+            pass
 
     async def wrapper() -> None:
-        async with ClientSession(timeout=_default_timeout) as session:
-            await asyncio.gather(*[check_url(session, url) for url in gen_list])
+        urls: Final[Iterator[str]] = iter(gen_source())
+
+        async def worker() -> None:
+            """
+            Check urls pulled from the shared url iterator.
+
+            Collects hits into a worker-local list & merges it
+            into check_list once when the worker finishes — even
+            when the worker is cancelled or interrupted mid-run.
 
-    asyncio.get_event_loop() \
-        .run_until_complete(wrapper())
+            Owns a single read buffer reused for every response.
+
+            :return: None.
+            """
+            local_hits: Final[list[str]] = []
+            buf: Final[bytearray] = bytearray(_max_content_len)
+
+            try:
+                for url in urls:
+                    await check_url(session, url, local_hits, buf)
+            finally:
+                check_list.extend(local_hits)
+
+        connector: Final[TCPConnector] = TCPConnector(
+            limit=concurrency,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+
+        async with ClientSession(connector=connector, timeout=_default_timeout) as session:
+            await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    asyncio.run(wrapper())
 
 
 def save_urls(path: str) -> None:
     """
     Save checked urls to the file.
 
+    Sorts the urls in place & streams them out line by line
+    instead of allocating a sorted copy plus one joined string.
+
     :param path: Path to the file to save to.
 
     :return: None.
     """
-    with open(path, 'w') as out_file:
-        out_file.write('\n'.join(sorted(check_list)))
+    check_list.sort()
+
+    with open(path, 'w', buffering=1 << 20) as out_file:
+        out_file.writelines(url + '\n' for url in check_list)
+
+
+_print_prefix: Final[str] = f'{fclr.RESET}{" " * 4}{fclr.LIGHTMAGENTA_EX}@ {fclr.LIGHTWHITE_EX}'
+_print_suffix: Final[str] = f'{fclr.RESET}\n'
 
 
 def _print_url(url: str) -> None:
     """
     Print the steam vanity url with the prefix '@'.
 
+    Concatenates the url with precomputed color affixes &
+    writes in one call instead of assembling an f-string per url.
+
+    Resolves the stdout write method at call time so that
+    streams wrapped after import e.g. by colorama are honored.
+
     :param url: Url to be printed.
     :return: None.
     """
-    print(f'{fclr.RESET}{" " * 4}{fclr.LIGHTMAGENTA_EX}@ {fclr.LIGHTWHITE_EX}{url}{fclr.RESET}')
+    sys.stdout.write(_print_prefix + url + _print_suffix)
@@ -15,13 +15,65 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import sys
+
+import re as regx
+
+from functools import lru_cache
 from inspect import getattr_static, isfunction
-from typing import Type, Callable, Final, Union, Any
+from typing import Type, Callable, Final, Optional, Union, Any
+from config import get_compiled
+
+_bool_values: Final[dict[str, bool]] = {
+    'true': True, 'yes': True, 'y': True,
+    'false': False, 'no': False, 'n': False
+}
+
+_clear_screen: Final[str] = '\x1b[2J\x1b[H'
+
+
+def cls() -> None:
+    """
+    Clear the terminal screen.
+
+    Writes the ANSI clear sequence directly to stdout
+    instead of spawning a shell subprocess.
+
+    :return: None.
+    """
+    sys.stdout.write(_clear_screen)
+    sys.stdout.flush()
+
+
+# A dash is only literal at the edges of a class —
+# anywhere else it may form a range expression.
+_char_class_pattern: Final[regx.Pattern] = regx.compile(r'^\[-?[a-z0-9_]+-?\]$')
+
 
-_yes_values: Final[list[str]] = ['true', 'yes', 'y']
-_no_values: Final[list[str]] = ['false', 'no', 'n']
+def compile_fast_pattern(pattern: str) -> Callable[[str], Any]:
+    """
+    Compile the pattern to the fastest matching predicate.
+
+    Dispatches literal patterns to a substring test & plain
+    character classes to a set-membership test, falling back
+    to the compiled regex search for everything else.
+
+    :param pattern: Pattern to compile.
+    :return: Predicate that returns a truthy value if the value matches.
+    :raise re.error: If the pattern is invalid.
+    """
+    if regx.escape(pattern) == pattern:
+        return lambda val: pattern in val
+
+    if _char_class_pattern.match(pattern):
+        chars: Final[frozenset[str]] = frozenset(pattern[1:-1])
+
+        return lambda val: not chars.isdisjoint(val)
+
+    return get_compiled(pattern).search
 
 
+@lru_cache(maxsize=None)
 def enum_values(clazz: Type) -> list:
     """
     Return enum class fields.
@@ -29,16 +81,24 @@ def enum_values(clazz: Type) -> list:
     Returns fields of the enum class if the field
     name does not start with an underscore or is not a method.
 
+    The reflection pass runs once per class — the result is cached.
+
     :param clazz: Enum class.
     :return: List of fields.
     """
     result: Final[list] = []
 
     for name, value in vars(clazz).items():
+        if name.startswith('_'):
+            continue
+
+        if type(value) in (str, int, float, bool):
+            result.append(value)
+            continue
+
         static_attr: Any = getattr_static(clazz, name)
 
-        if name.startswith('_') \
-                or isfunction(value) \
+        if isfunction(value) \
                 or isinstance(static_attr, staticmethod) \
                 or isinstance(static_attr, classmethod):
             continue
@@ -57,7 +117,7 @@ def limit(val: Union[int, float], min_val: Union[int, float], max_val: Union[int
     :param max_val: Maximum bound.
     :return: Limited value.
     """
-    return max(min(val, max_val), min_val)
+    return val if min_val <= val <= max_val else (min_val if val < min_val else max_val)
 
 
 def number(val: Union[Callable[[], Union[int, float]], int, float]) -> Union[int, float]:
@@ -70,8 +130,8 @@ def number(val: Union[Callable[[], Union[int, float]], int, float]) -> Union[int
     """
     r = val
 
-    if isinstance(r, Callable):
-        r = val()
+    if callable(r):
+        r = r()
 
     if not (isinstance(r, int) or isinstance(r, float)):
         raise ValueError()
@@ -94,12 +154,9 @@ def boolean(val: Union[bool, str]) -> bool:
         return val
 
     if isinstance(val, str):
-        val = val.lower()
-
-        is_yes: Final[bool] = val in _yes_values
-        is_no: Final[bool] = val in _no_values
+        r: Final[Optional[bool]] = _bool_values.get(val.lower())
 
-        if is_yes != is_no:
-            return is_yes
+        if r is not None:
+            return r
 
     raise ValueError()